@@ -2,91 +2,28 @@
 
 const fs = require('fs');
 const path = require('path');
-const { execSync, spawn } = require('child_process');
+const { spawn } = require('child_process');
 
-/**
- * Generate the React dashboard based on evaluation results
- * @param {string} resultsPath - Path to the JSON results file
- * @param {string} outputDir - Directory to save the dashboard
- */
-function generateDashboard(resultsPath, outputDir) {
-  // Create output directory if it doesn't exist
-  if (!fs.existsSync(outputDir)) {
-    fs.mkdirSync(outputDir, { recursive: true });
-  }
-  
-  console.log(`\nGenerating dashboard in ${outputDir}`);
-  
-  // Create necessary files for the React app
-  // 1. Create package.json
-  const packageJson = {
-    "name": "htr-evaluation-dashboard",
-    "version": "1.0.0",
-    "description": "Dashboard for HTR evaluation results",
-    "main": "index.js",
-    "scripts": {
-      "start": "parcel index.html",
-      "build": "parcel build index.html"
-    },
-    "dependencies": {
-      "react": "^17.0.2",
-      "react-dom": "^17.0.2"
-    },
-    "devDependencies": {
-      "parcel": "^2.0.1"
-    }
-  };
-  
-  fs.writeFileSync(
-    path.join(outputDir, "package.json"),
-    JSON.stringify(packageJson, null, 2)
-  );
-  
-  // 2. Create index.html
-  const indexHtml = `<!DOCTYPE html>
+// Static parts of index.html, encoded once, before and after the inlined
+// results. React and Babel are loaded from a CDN, so the JSX component below
+// runs directly in the browser
+const HTML_HEAD = Buffer.from(`<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>HTR Evaluation Dashboard</title>
     <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
+    <script crossorigin src="https://unpkg.com/react@17.0.2/umd/react.production.min.js"></script>
+    <script crossorigin src="https://unpkg.com/react-dom@17.0.2/umd/react-dom.production.min.js"></script>
+    <script src="https://unpkg.com/@babel/standalone@7.23.5/babel.min.js"></script>
 </head>
 <body>
     <div id="root"></div>
-    <script type="module" src="./index.js"></script>
-</body>
-</html>`;
-  
-  fs.writeFileSync(path.join(outputDir, "index.html"), indexHtml);
-  
-  // 3. Create index.js
-  const indexJs = `import React from 'react';
-import ReactDOM from 'react-dom';
-import App from './App';
-
-ReactDOM.render(<App />, document.getElementById('root'));`;
-  
-  fs.writeFileSync(path.join(outputDir, "index.js"), indexJs);
-  
-  // 4. Create App.js with the dashboard component
-  const appJs = `import React from 'react';
-import Dashboard from './Dashboard';
-import results from './results.json';
-
-const App = () => {
-    return <Dashboard results={results} />;
-};
-
-export default App;`;
-  
-  fs.writeFileSync(path.join(outputDir, "App.js"), appJs);
-  
-  // 5. Copy results.json to the output directory
-  fs.copyFileSync(resultsPath, path.join(outputDir, "results.json"));
-  
-  // 6. Create Dashboard.js component
-  const dashboardJs = `import React from 'react';
+    <script>window.__RESULTS__ = `);
 
+const HTML_TAIL = Buffer.from(`;</script>
+    <script type="text/babel">
 const Dashboard = ({ results }) => {
   // Color coding for scores
   const getScoreColor = (score) => {
@@ -209,64 +146,77 @@ const Dashboard = ({ results }) => {
   );
 };
 
-export default Dashboard;`;
+ReactDOM.render(<Dashboard results={window.__RESULTS__} />, document.getElementById('root'));
+    </script>
+</body>
+</html>
+`);
+
+/**
+ * Generate the dashboard based on evaluation results, as a single
+ * self-contained HTML file (no npm install or build step)
+ * @param {string} resultsPath - Path to the JSON results file
+ * @param {string} outputDir - Directory to save the dashboard
+ * @returns {string} Path to the generated index.html
+ */
+function generateDashboard(resultsPath, outputDir) {
+  // Create output directory if it doesn't exist (a no-op when it does)
+  fs.mkdirSync(outputDir, { recursive: true });
+  
+  console.log(`\nGenerating dashboard in ${outputDir}`);
+  
+  // The results are inlined as a JavaScript literal. Escaping "<" keeps a
+  // value such as "</script>" from closing the script element.
+  const results = fs.readFileSync(resultsPath, 'utf8').replace(/</g, '\\u003c');
+  
+  const chunks = [HTML_HEAD, Buffer.from(results), HTML_TAIL];
   
-  fs.writeFileSync(path.join(outputDir, "Dashboard.js"), dashboardJs);
+  // Written to a temporary file and renamed into place, so a browser
+  // reloading the page never reads a partial file. The three parts go out
+  // in a single writev, without being concatenated first.
+  const htmlPath = path.join(outputDir, "index.html");
+  const fd = fs.openSync(`${htmlPath}.tmp`, 'w');
+  try {
+    const size = chunks.reduce((total, chunk) => total + chunk.length, 0);
+    if (fs.writevSync(fd, chunks) !== size) {
+      throw new Error(`Short write to ${htmlPath}.tmp`);
+    }
+  } finally {
+    fs.closeSync(fd);
+  }
+  fs.renameSync(`${htmlPath}.tmp`, htmlPath);
   
-  console.log(`Dashboard files created in ${outputDir}`);
-  return path.join(outputDir, "index.html");
+  console.log(`Dashboard created at ${htmlPath}`);
+  return htmlPath;
 }
 
 /**
- * Launch the dashboard using npm
+ * Open the dashboard in the default web browser
  * @param {string} dashboardDir - Path to the dashboard directory
  */
 function launchDashboard(dashboardDir) {
-  const originalDir = process.cwd();
+  const htmlPath = path.resolve(dashboardDir, "index.html");
   
-  try {
-    // Change to the dashboard directory
-    process.chdir(dashboardDir);
-    
-    console.log(`\nSetting up and launching dashboard from ${dashboardDir}`);
-    
-    // Run npm install
-    console.log("Installing dependencies (npm install)...");
-    execSync('npm install', { stdio: 'inherit' });
-    
-    // Display access instructions
-    console.log("\n" + "=".repeat(60));
-    console.log("DASHBOARD ACCESS INSTRUCTIONS:");
-    console.log("=".repeat(60));
-    console.log("Once the server starts:");
-    console.log("1. Open your web browser");
-    console.log("2. Navigate to: http://localhost:1234");
-    console.log("=".repeat(60));
-    console.log("\nPress Ctrl+C to stop the server when done.");
-    
-    // Start the parcel server
-    console.log("\nStarting Parcel development server (npm start)...");
-    const npmStart = spawn('npm', ['start'], { 
-      stdio: 'inherit',
-      shell: true 
-    });
-    
-    // Handle server process events
-    npmStart.on('error', (err) => {
-      console.error(`Error starting npm: ${err}`);
-    });
-    
-    npmStart.on('close', (code) => {
-      console.log(`Server process exited with code ${code}`);
-      // Change back to original directory
-      process.chdir(originalDir);
-    });
-    
-  } catch (error) {
-    console.error(`Error running npm commands: ${error}`);
-    // Ensure we change back to the original directory in case of error
-    process.chdir(originalDir);
+  // Platform-specific command opening a file with its default application
+  let command = 'xdg-open';
+  let args = [htmlPath];
+  if (process.platform === 'darwin') {
+    command = 'open';
+  } else if (process.platform === 'win32') {
+    // explorer opens the file with its default application, like start,
+    // without going through cmd, which does not understand the argument
+    // quoting Node applies on Windows
+    command = 'explorer';
   }
+  
+  console.log(`\nOpening dashboard: ${htmlPath}`);
+  // Detached and unreferenced, so neither this script nor the Python
+  // evaluation waits for the browser (or xdg-open) to finish starting
+  const opener = spawn(command, args, { stdio: 'ignore', detached: true });
+  opener.on('error', (err) => {
+    console.error(`Could not open a browser (${err.message}). Open ${htmlPath} manually.`);
+  });
+  opener.unref();
 }
 
 /**
@@ -291,7 +241,7 @@ function main() {
   }
   
   // Generate dashboard
-  const htmlPath = generateDashboard(resultsPath, outputDir);
+  generateDashboard(resultsPath, outputDir);
   
   // Launch dashboard
   launchDashboard(outputDir);
@@ -2,23 +2,146 @@ import json
 import os
 import argparse
 import re
-from typing import Dict, Tuple, Any
+import sys
+import mmap
+import hashlib
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-def flatten_json(obj: Dict, prefix: str = '') -> Dict:
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:  # fall back to editdistance or the pure-Python implementation below
+    Levenshtein = None
+
+try:
+    import editdistance
+except ImportError:
+    editdistance = None
+
+try:
+    import numpy
+except ImportError:  # needed by both cpdist and the Numba kernels below
+    numpy = None
+
+cpdist = None
+if numpy is not None:
+    try:
+        # cpdist returns a numpy array, so batching needs numpy on top of rapidfuzz
+        from rapidfuzz.process import cpdist
+    except ImportError:
+        pass
+
+def _json_dumps_stdlib(obj: Any) -> bytes:
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+try:
+    import orjson
+
+    # orjson reads integers beyond 64 bits as floats and rejects NaN and
+    # Infinity, all of which json accepts. Documents with a run of 19 digits
+    # (possibly such an integer) or that orjson rejects are parsed by json,
+    # so that both backends give the same values.
+    _LONG_DIGITS = re.compile(rb'\d{19}')
+
+    def _json_loads(data: Any) -> Any:
+        if _LONG_DIGITS.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        # json.loads takes bytes, not the memoryview of a memory-mapped file
+        return json.loads(bytes(data))
+
+    # orjson parses a memoryview of a memory-mapped file without copying it
+    _JSON_LOADS_BUFFERS = True
+
+    def _json_dumps(obj: Any) -> bytes:
+        # Same values as _json_dumps_stdlib, but not always the same bytes:
+        # some floats are formatted differently (0.00001 and 1e16 where json
+        # writes 1e-05 and 1e+16), and NaN and Infinity are written as null
+        # (json writes them as invalid JSON)
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits
+            return _json_dumps_stdlib(obj)
+except ImportError:
+    # json.loads also accepts UTF-8 bytes
+    _json_loads = json.loads
+    _JSON_LOADS_BUFFERS = False
+    _json_dumps = _json_dumps_stdlib
+
+_NON_DIGIT = re.compile(r'\D')
+# str.translate table deleting every ASCII character except 0-9
+_ASCII_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+# Substrings of (lowercased) field names used to classify and weight fields
+_PHONE_TERMS = ('tel', 'téléphone', 'phone') # I included more types in case we'll use this doc in other document formats
+_NUMERIC_TERMS = ('nombre', 'nbre', 'count', 'montant', 'amount')
+_NAME_TERMS = ('nom', 'name', 'id', 'matricule')
+_CONTACT_TERMS = ('addresse', 'address', 'tel', 'email')
+
+def _terms_pattern(terms: Tuple[str, ...]) -> 're.Pattern':
+    """Compile a list of substrings into one alternation searched in a single pass."""
+    return re.compile('|'.join(map(re.escape, terms)))
+
+_PHONE_RE = _terms_pattern(_PHONE_TERMS)
+_NUMERIC_RE = _terms_pattern(_NUMERIC_TERMS)
+_NAME_RE = _terms_pattern(_NAME_TERMS)
+_CONTACT_RE = _terms_pattern(_CONTACT_TERMS)
+
+# Size from which input files are memory-mapped instead of read (with orjson)
+_MMAP_MIN_SIZE = 1 << 20
+
+# Number of batched pairs from which cpdist is run on all cores
+_CPDIST_THREADED_MIN = 10_000
+
+# String values treated as null (compared after strip() and lower())
+_NULL_STRINGS = frozenset(("null", "none", "-", "nan", ""))
+
+# Similarity thresholds of the error categories: similarities from
+# MINOR_THRESHOLD are minor errors, from SEMANTIC_THRESHOLD semantic
+# differences, and lower ones critical errors. Every similarity computation
+# uses SEMANTIC_THRESHOLD as its cutoff.
+MINOR_THRESHOLD = 0.9
+SEMANTIC_THRESHOLD = 0.5
+
+# Error categories in the order they appear in the results
+_ERROR_CATEGORIES = ("critical", "semantic", "minor", "perfect")
+_CATEGORY_INDEX = {category: index for index, category in enumerate(_ERROR_CATEGORIES)}
+
+def flatten_json(obj: Dict, prefix: str = '', skip_prefixes: Tuple[str, ...] = ()) -> Dict:
     """
     Flatten a nested JSON object into a single-level dictionary.
     # nested_json = {"person": {"name": "John", "address": {"city": "Paris"}}}
     # flattened = flatten_json(nested_json)
     # Result: {"person.name": "John", "person.address.city": "Paris"}
+
+    Top-level keys starting with one of skip_prefixes are left out along
+    with their whole subtree, which is never traversed.
     """
     result = {}
-    for key, value in obj.items():
-        new_key = f"{prefix}.{key}" if prefix else key
-        if isinstance(value, dict):
-            result.update(flatten_json(value, new_key))
+    items = iter(obj.items())
+    if skip_prefixes:
+        items = ((key, value) for key, value in items if not key.startswith(skip_prefixes))
+    # Explicit stack of (prefix, items iterator) pairs instead of recursion.
+    # Resuming the parent's iterator after a nested dict keeps the key order.
+    stack = [(prefix, items)]
+    push, pop, intern = stack.append, stack.pop, sys.intern
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            new_key = f"{prefix}.{key}" if prefix else key
+            if isinstance(value, dict):
+                push((new_key, iter(value.items())))
+                break
+            # Interned keys let gold/pred lookups compare by identity
+            result[intern(new_key)] = value
         else:
-            result[new_key] = value
+            pop()
     return result
 
 def normalize_value(value: Any) -> str:
@@ -35,7 +158,7 @@ def normalize_value(value: Any) -> str:
     
     value_str = str(value).strip().lower()
     
-    if value_str in ["null", "none", "-", "nan"]:
+    if value_str in _NULL_STRINGS:
         return ""
     
     return value_str
@@ -46,13 +169,227 @@ def is_null_value(value: Any) -> bool:
     """
     if value is None:
         return True
+    return isinstance(value, str) and value.strip().lower() in _NULL_STRINGS
+
+def _is_null_normalized(value: Any, value_str: str) -> bool:
+    """
+    is_null_value computed from the value and its normalize_value() string.
+
+    Only None and null-like strings are null: a non-string value such as a
+    float nan also normalizes to "" but is kept as a real value.
+    """
+    return not value_str and (value is None or isinstance(value, str))
+
+def _strip_common_affixes(s1: str, s2: str) -> Tuple[str, str]:
+    """
+    Remove the common prefix and suffix of two strings.
+
+    They do not change the Levenshtein distance, so the distance only needs
+    to be computed on the differing middle parts.
+    """
+    start = 0
+    shortest = min(len(s1), len(s2))
+    while start < shortest and s1[start] == s2[start]:
+        start += 1
+    end1, end2 = len(s1), len(s2)
+    while end1 > start and end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    return s1[start:end1], s2[start:end2]
+
+def _bit_parallel_distance_py(pattern: str, text: str, max_distance: int = sys.maxsize) -> int:
+    """
+    Myers/Hyyrö bit-parallel Levenshtein distance in pure Python.
+
+    The DP column for pattern is held in the VP/VN bit vectors, so each
+    character of text costs a few integer operations instead of
+    len(pattern) cell updates. Python integers have no fixed width, so
+    patterns longer than 64 characters simply use wider bit vectors.
+
+    Returns max_distance + 1 as soon as the distance is known to exceed
+    max_distance (which must not exceed len(pattern) + len(text)).
+    """
+    peq = {}
+    bit = 1
+    for c in pattern:
+        peq[c] = peq.get(c, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    last = bit >> 1
+    vp = mask
+    vn = 0
+    distance = len(pattern)
+    # The distance drops by at most 1 per remaining text character, so it
+    # exceeds max_distance once it is above max_distance + remaining
+    budget = max_distance + len(text)
+    get = peq.get
+    for c in text:
+        x = get(c, 0) | vn
+        d0 = (((x & vp) + vp) ^ vp) | x
+        hp = vn | (~(d0 | vp) & mask)
+        hn = vp & d0
+        if hp & last:
+            distance += 1
+        elif hn & last:
+            distance -= 1
+        budget -= 1
+        if distance > budget:
+            return max_distance + 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = hn | (~(d0 | hp) & mask)
+        vn = hp & d0
+    return distance
+
+def _levenshtein_distance(s1: str, s2: str, max_distance: int = sys.maxsize) -> int:
+    """
+    Pure-Python Levenshtein distance, used when rapidfuzz is not installed.
+
+    When the distance exceeds max_distance, any value above max_distance
+    may be returned.
+    """
+    s1, s2 = _strip_common_affixes(s1, s2)
     
-    if isinstance(value, str):
-        normalized = value.strip().lower()
-        return normalized in ["null", "none", "-", "nan", ""]
+    # The shorter string is the bit-parallel pattern
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    
+    if not s2:
+        return len(s1)
+    # The distance is at most len(s1)
+    return _bit_parallel_distance_py(s2, s1, min(max_distance, len(s1)))
+
+# Numba takes a few hundred milliseconds to import, so it is only imported
+# when neither rapidfuzz nor editdistance is installed and its kernels are used
+njit = None
+if Levenshtein is None and editdistance is None and numpy is not None:
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+
+if njit is not None:
+    @njit(cache=True)
+    def _bit_parallel_distance(pattern, text, max_distance):
+        """
+        Hyyrö's bit-parallel Levenshtein distance between two uint8 arrays.
+
+        The DP column for pattern (at most 64 characters) is encoded in the
+        VP/VN bit vectors of a single uint64, so each character of text costs
+        a handful of bitwise operations instead of len(pattern) cell updates.
+        Stops with max_distance + 1 once the distance must exceed max_distance.
+        """
+        one = numpy.uint64(1)
+        peq = numpy.zeros(256, dtype=numpy.uint64)
+        for i in range(len(pattern)):
+            peq[pattern[i]] |= one << numpy.uint64(i)
+        
+        last = one << numpy.uint64(len(pattern) - 1)
+        vp = ~numpy.uint64(0)
+        vn = numpy.uint64(0)
+        distance = len(pattern)
+        budget = max_distance + len(text)
+        for j in range(len(text)):
+            x = peq[text[j]] | vn
+            d0 = (((x & vp) + vp) ^ vp) | x
+            hp = vn | ~(d0 | vp)
+            hn = vp & d0
+            if hp & last:
+                distance += 1
+            elif hn & last:
+                distance -= 1
+            budget -= 1
+            if distance > budget:
+                return max_distance + 1
+            hp = (hp << one) | one
+            hn = hn << one
+            vp = hn | ~(d0 | hp)
+            vn = hp & d0
+        return distance
+
+    @njit(cache=True)
+    def _wagner_fischer_distance(s1, s2, max_distance):
+        """
+        Wagner-Fischer Levenshtein distance between two int32 arrays.
+
+        A single row is updated in place: the diagonal and left cells of
+        the previous row are carried in scalars. The final distance is at
+        least the minimum of any row, so the computation stops with
+        max_distance + 1 once a whole row exceeds max_distance.
+        """
+        n = len(s2)
+        row = numpy.arange(n + 1, dtype=numpy.int32)
+        for i in range(len(s1)):
+            c1 = s1[i]
+            diagonal = row[0]
+            left = i + 1
+            row[0] = left
+            row_min = left
+            for j in range(n):
+                above = row[j + 1]
+                cost = diagonal + (c1 != s2[j])
+                if left + 1 < cost:
+                    cost = left + 1
+                if above + 1 < cost:
+                    cost = above + 1
+                row[j + 1] = cost
+                diagonal = above
+                left = cost
+                if cost < row_min:
+                    row_min = cost
+            if row_min > max_distance:
+                return max_distance + 1
+        return row[n]
 
+    def _codepoints(s: str) -> 'numpy.ndarray':
+        """One int32 per character (surrogates included) for the Numba kernels."""
+        return numpy.frombuffer(s.encode('utf-32-le', 'surrogatepass'), dtype=numpy.int32)
 
-def compute_string_similarity(str1: str, str2: str) -> float:
+    def _numba_distance(s1: str, s2: str, max_distance: int = sys.maxsize) -> int:
+        """
+        Levenshtein distance with the Numba kernels.
+
+        When the distance exceeds max_distance, any value above max_distance
+        may be returned.
+        """
+        s1, s2 = _strip_common_affixes(s1, s2)
+        if len(s1) < len(s2):
+            s1, s2 = s2, s1
+        if not s2:
+            return len(s1)
+        # The distance is at most len(s1); this also keeps the kernels' int64
+        # arithmetic from overflowing with the default bound
+        max_distance = min(max_distance, len(s1))
+        # The bit-parallel kernel works on bytes (so per character only for
+        # ASCII) and keeps the DP column of the shorter string in one 64-bit word
+        if len(s2) <= 64 and s1.isascii() and s2.isascii():
+            return int(_bit_parallel_distance(numpy.frombuffer(s2.encode('ascii'), dtype=numpy.uint8),
+                                              numpy.frombuffer(s1.encode('ascii'), dtype=numpy.uint8),
+                                              max_distance))
+        return int(_wagner_fischer_distance(_codepoints(s1), _codepoints(s2), max_distance))
+
+def _editdistance_distance(s1: str, s2: str, max_distance: int = sys.maxsize) -> int:
+    """editdistance.eval with the backends' signature (it has no bounded variant)."""
+    return editdistance.eval(s1, s2)
+
+# Distance used when rapidfuzz is not installed: editdistance (C++), then the
+# Numba kernel, then pure Python. Each takes a max_distance bound.
+if editdistance is not None:
+    _edit_distance = _editdistance_distance
+elif njit is not None:
+    _edit_distance = _numba_distance
+else:
+    _edit_distance = _levenshtein_distance
+
+def _similarity_upper_bound(str1: str, str2: str) -> float:
+    """
+    Upper bound of the similarity of two non-empty strings: the edit distance
+    is at least their length difference.
+    """
+    len1, len2 = len(str1), len(str2)
+    return 1.0 - abs(len1 - len2) / (len1 if len1 > len2 else len2)
+
+def compute_string_similarity(str1: str, str2: str, score_cutoff: float = 0.0) -> float:
     """
     Compute string similarity using Levenshtein distance.
     
@@ -61,271 +398,584 @@ def compute_string_similarity(str1: str, str2: str) -> float:
     2. Handles different string lengths naturally
     3. Is more intuitive for text recognition metrics
     
-    Returns a similarity ratio from 0.0 (completely different) to 1.0 (identical)
+    Uses the rapidfuzz C extension when available, then editdistance.
+    Returns a similarity ratio from 0.0 (completely different) to 1.0 (identical).
+    Similarities below score_cutoff are returned as 0.0, which lets pairs that
+    cannot reach the cutoff skip the distance computation.
+
+    Both strings must already be normalized (normalize_value or
+    normalize_field); use compute_string_similarity_unnormalized otherwise.
     """
     if not str1 and not str2:
         return 1.0 # perfect match
     if not str1 or not str2:
         return 0.0  #  no match
     
-    str1 = normalize_value(str1)
-    str2 = normalize_value(str2)
+    max_len = max(len(str1), len(str2))
+    if score_cutoff and _similarity_upper_bound(str1, str2) < score_cutoff:
+        return 0.0
+    
+    if Levenshtein is not None:
+        return Levenshtein.normalized_similarity(str1, str2, score_cutoff=score_cutoff)
     
-    # Calculate Levenshtein distance
-    def levenshtein_distance(s1, s2):
-        if len(s1) < len(s2):
-            return levenshtein_distance(s2, s1)
-        
-        # len(s1) >= len(s2)
-        if len(s2) == 0:
-            return len(s1)
-        
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        
-        return previous_row[-1]
+    # Largest distance that can still reach score_cutoff. The +1 absorbs float
+    # rounding (e.g. (1 - 0.9) * 10 < 1); the final check below is exact.
+    max_distance = int((1.0 - score_cutoff) * max_len) + 1
     
     #converting to similarity ratio
-    distance = levenshtein_distance(str1, str2)
-    max_len = max(len(str1), len(str2))
-    if max_len == 0:
-        return 1.0
+    distance = _edit_distance(str1, str2, max_distance)
     similarity = 1.0 - (distance / max_len)
-    return similarity
+    return similarity if similarity >= score_cutoff else 0.0
+
+def compute_string_similarity_unnormalized(str1: Any, str2: Any, score_cutoff: float = 0.0) -> float:
+    """compute_string_similarity for raw values, which are passed through normalize_value first."""
+    # Normalized before the empty checks, so that e.g. "null" and "" compare as empty
+    return compute_string_similarity(normalize_value(str1), normalize_value(str2), score_cutoff)
+
+def _keep_digits(value_str: str) -> str:
+    """Remove every non-digit character (same result as _NON_DIGIT.sub)."""
+    if value_str.isascii():
+        return value_str.translate(_ASCII_NON_DIGITS)
+    # Non-ASCII strings may contain other Unicode digits, which \d also keeps
+    return _NON_DIGIT.sub('', value_str)
 
 def normalize_phone(phone_str: str) -> str:
     """Normalize phone numbers by removing non-numeric characters."""
     if not phone_str:
         return ""
-    return re.sub(r'\D', '', phone_str)
+    return _keep_digits(phone_str)
+
+def _field_kind(field: str) -> str:
+    """Classify a field name as 'phone', 'numeric', 'date' or 'text' for normalization."""
+    field_lower = field.lower()
+    if _PHONE_RE.search(field_lower):
+        return 'phone'
+    if _NUMERIC_RE.search(field_lower):
+        return 'numeric'
+    if 'date' in field_lower:
+        return 'date'
+    return 'text'
 
 def normalize_field(field: str, value: Any) -> str:
     """
     Apply field-specific normalization rules.
     # normalize_field("nbre_de_salariés", "2,125")
     # returns: "2125" (extracts only numbers)
+
+    The scoring applies the same steps without this wrapper; the rules are
+    in _field_kind and _normalize_digits.
+    """
+    return _normalize_kind(_classify_field(field)[0], normalize_value(value))
+
+def _normalize_kind(kind: str, value_str: str) -> str:
     """
-    value_str = normalize_value(value)
+    normalize_field for a value already passed through normalize_value,
+    given the field kind from _classify_field.
+    """
+    # Text values are used as they are; only the digit extractions are cached
+    if kind == 'text':
+        return value_str
+    return _normalize_digits(kind, value_str)
+
+# Phone numbers, dates and amounts recur across documents (and gold values
+# across every prediction compared to them)
+@lru_cache(maxsize=100_000)
+def _normalize_digits(kind: str, value_str: str) -> str:
+    """Digit normalization of a 'phone', 'numeric' or 'date' value."""
     # Phone number
-    if any(phone_term in field.lower() for phone_term in ['tel', 'téléphone', 'phone']): # I included more types in case we'll use this doc in other document formats
+    if kind == 'phone':
         return normalize_phone(value_str)
     # Numeric field
-    if any(num_term in field.lower() for num_term in ['nombre', 'nbre', 'count', 'montant', 'amount']):
+    if kind == 'numeric':
         # Extract numbers from the string
-        nums = re.findall(r'\d+', value_str)
-        return ''.join(nums) if nums else value_str
-    if 'date' in field.lower():
+        digits = _keep_digits(value_str)
+        return digits if digits else value_str
+    if kind == 'date':
         # Simple date normalization - extract numbers
-        return re.sub(r'\D', '', value_str)
+        return _keep_digits(value_str)
     return value_str
 
 def categorize_error(gold_value: Any, pred_value: Any, field: str) -> Tuple[str, float]:
     """Categorize the error type and assign a score"""
     
+    # Each value is stringified once; the null checks reuse those strings
+    gold_str = normalize_value(gold_value)
+    pred_str = normalize_value(pred_value)
+    
     # Special handling for null values
-    gold_is_null = is_null_value(gold_value)
-    pred_is_null = is_null_value(pred_value)
+    gold_is_null = _is_null_normalized(gold_value, gold_str)
+    pred_is_null = _is_null_normalized(pred_value, pred_str)
     if gold_is_null and pred_is_null:
         return "perfect", 1.0
     if gold_is_null != pred_is_null:
         return "critical", 0.0
     
     # For normal fields using string similarity
-    gold_norm = normalize_field(field, gold_value)
-    pred_norm = normalize_field(field, pred_value)
+    kind = _classify_field(field)[0]
+    return _categorize_similarity(_normalize_kind(kind, gold_str), _normalize_kind(kind, pred_str))
+
+def _categorize_similarity(gold_norm: str, pred_norm: str,
+                           similarity: Optional[float] = None) -> Tuple[str, float]:
+    """
+    Categorize two non-null values from their field-normalized strings,
+    applying the category thresholds. The similarity is computed if None.
+    """
     if gold_norm == pred_norm:
         return "perfect", 1.0
-    similarity = compute_string_similarity(str(gold_value), str(pred_value))
-    if similarity >= 0.9:
+    # e.g. a phone number read without any digit: nothing to compare
+    if not gold_norm or not pred_norm:
+        return "critical", 0.0
+    # Anything below the "semantic" threshold is critical, whatever its exact value
+    if similarity is None:
+        # O(1) length filter before calling into the similarity computation
+        if _similarity_upper_bound(gold_norm, pred_norm) < SEMANTIC_THRESHOLD:
+            return "critical", 0.0
+        similarity = compute_string_similarity(gold_norm, pred_norm, score_cutoff=SEMANTIC_THRESHOLD)
+    if similarity >= MINOR_THRESHOLD:
         return "minor", 0.8
-    elif similarity >= 0.5:
+    elif similarity >= SEMANTIC_THRESHOLD:
         return "semantic", 0.5
     else:
         return "critical", 0.0
 
-
 def get_field_weight(field: str) -> float:
     """
     Assign importance weights to different fields.
 
     To discuss with clients to determine the most important fields.
     """
-    if any(name_term in field.lower() for name_term in ['nom', 'name', 'id', 'matricule']):
+    field_lower = field.lower()
+    if _NAME_RE.search(field_lower):
         return 2.0
-    if any(contact_term in field.lower() for contact_term in ['addresse', 'address', 'tel', 'email']):
-        return 1.5
-    if any(num_term in field.lower() for num_term in ['nombre', 'nbre', 'count', 'montant', 'amount']):
+    if _CONTACT_RE.search(field_lower) or _NUMERIC_RE.search(field_lower):
         return 1.5
     # Default weight
     return 1.0
 
-def evaluate_documents(gold_path: str, pred_path: str) -> Dict:
+# Field names repeat within and across documents: both classifications are
+# computed once per name and fetched together
+@lru_cache(maxsize=None)
+def _classify_field(field: str) -> Tuple[str, float]:
+    """Return the (kind, weight) of a field, see _field_kind and get_field_weight."""
+    return _field_kind(field), get_field_weight(field)
+
+def _load_json(path: str) -> Any:
+    """Parse a JSON file, memory-mapping it when it is large and orjson is available."""
+    with open(path, 'rb') as f:
+        if _JSON_LOADS_BUFFERS and os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            # The kernel pages the file in; no Python bytes copy is made
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                    memoryview(mapped) as view:
+                return _json_loads(view)
+        return _json_loads(f.read())
+
+def _load_gold(gold_path: str, cache_dir: Optional[str] = None,
+               data: Optional[bytes] = None, digest: Optional[bytes] = None) -> Dict:
+    """
+    Load and flatten a gold standard, through a cache in cache_dir.
+
+    The same gold file is usually compared with many predictions, so with a
+    cache_dir the flattened dictionary is stored there as JSON, keyed on a
+    BLAKE2b hash of the gold content and of this script. data and digest are
+    the content of the gold file and its _file_digest when already known.
+    """
+    if cache_dir is None:
+        # The metadata subtrees are skipped while flattening
+        document = _load_json(gold_path) if data is None else _json_loads(data)
+        return flatten_json(document, skip_prefixes=('metadata',))
+    
+    if data is None:
+        data = _read_file(gold_path)
+    if digest is None:
+        digest = _file_digest(data)
+    name = hashlib.blake2b(_code_digest() + digest, digest_size=20).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{name}.flat.json")
+    try:
+        cached = _load_json(cache_path)
+        # Parsed keys are not interned
+        return {sys.intern(key): value for key, value in cached.items()}
+    except (OSError, ValueError, KeyError):
+        # Missing or unreadable cache: parse the gold file again
+        pass
+    
+    filtered_gold = flatten_json(_json_loads(data), skip_prefixes=('metadata',))
+    # Written with json rather than orjson, which would turn NaN and Infinity
+    # values into null
+    _write_cache_file(cache_path, json.dumps(filtered_gold, ensure_ascii=False).encode('utf-8'))
+    return filtered_gold
+
+def _load_pred(pred_path: str, data: Optional[bytes] = None) -> Dict:
+    """
+    Load and flatten a prediction, with spaces in field names replaced by
+    underscores. data is the content of the file when it was already read.
+    """
+    document = _load_json(pred_path) if data is None else _json_loads(data)
+    filtered_pred = {}
+    for key, value in flatten_json(document, skip_prefixes=('metadata',)).items():
+        normalized_key = sys.intern(key.replace(' ', '_'))
+        filtered_pred[normalized_key] = value
+    return filtered_pred
+
+def evaluate_documents(gold_path: str, pred_path: str, cache_dir: Optional[str] = None) -> Dict:
     """
     Returns a dictionary with evaluation metrics.
+
+    The string similarities of the document are computed in one batch
+    (see evaluate_documents_batch, which also describes cache_dir).
     """
-    with open(gold_path, 'r', encoding='utf-8') as f:
-        gold_json = json.load(f)
-    with open(pred_path, 'r', encoding='utf-8') as f:
-        pred_json = json.load(f)
-
-    flat_gold = flatten_json(gold_json)
-    flat_pred = flatten_json(pred_json)
-    
-    normalized_flat_pred = {}
-    for key, value in flat_pred.items():
-        normalized_key = key.replace(' ', '_')
-        normalized_flat_pred[normalized_key] = value
-
-    flat_pred = normalized_flat_pred
-    
-    filtered_gold = {k: v for k, v in flat_gold.items() if not k.startswith('metadata')}
-    filtered_pred = {k: v for k, v in flat_pred.items() if not k.startswith('metadata')}
-
-    results = {
-        "total_score": 0.0,
-        "total_weight": 0.0,
-        "field_scores": {},
-        "missing_fields": [],
-        "extra_fields": [],
-        "error_categories": {
-            "critical": 0,
-            "semantic": 0,
-            "minor": 0,
-            "perfect": 0
-        },
-        "detailed_errors": []
-    }
+    return evaluate_documents_batch([(gold_path, pred_path)], cache_dir=cache_dir)[0]
+
+def score_documents(filtered_gold: Dict, filtered_pred: Dict,
+                    similarities: Optional[Dict[str, float]] = None,
+                    normalized: Optional[Dict[str, Tuple[str, str]]] = None) -> Dict:
+    """
+    Compute the evaluation metrics of two flattened documents.
+
+    similarities optionally maps field names to precomputed string
+    similarities of their normalized values, and normalized to the
+    already normalized (gold, pred) values.
+    """
+    if similarities is None:
+        similarities = {}
+    if normalized is None:
+        normalized = {}
+
+    # Accumulate into locals and parallel lists; the nested results dict is
+    # only assembled once at the end
+    total_score = 0.0
+    total_weight = 0.0
+    field_scores = {}
+    missing_fields = []
+    extra_fields = []
+    category_counts = [0] * len(_ERROR_CATEGORIES)
+    error_fields, error_golds, error_preds, error_types, error_scores = [], [], [], [], []
     
-    for field in filtered_gold:
+    # Bind the functions and list methods used per field to locals
+    stringify, is_null, classify = normalize_value, _is_null_normalized, _classify_field
+    normalize = _normalize_kind
+    categorize, similarity_of, normalized_of = _categorize_similarity, similarities.get, normalized.get
+    add_field, add_gold, add_pred = error_fields.append, error_golds.append, error_preds.append
+    add_type, add_score = error_types.append, error_scores.append
+    category_index = _CATEGORY_INDEX
+    critical_index, perfect_index = category_index["critical"], category_index["perfect"]
+    
+    # Single pass over the gold fields: missing and common fields are handled
+    # together, and each value's null check is done only once
+    for field, gold_value in filtered_gold.items():
+        gold_str = stringify(gold_value)
+        gold_is_null = is_null(gold_value, gold_str)
         if field not in filtered_pred:
-            if not is_null_value(filtered_gold[field]):
-                results["missing_fields"].append(field)
-                results["error_categories"]["critical"] += 1
-                results["detailed_errors"].append({
-                    "field": field,
-                    "gold": filtered_gold[field],
-                    "pred": None,
-                    "type": "critical",
-                    "score": 0.0
-                })
-    
-    for field in filtered_pred:
-        if field not in filtered_gold:
-            if not is_null_value(filtered_pred[field]):
-                results["extra_fields"].append(field)
-    
-    for field in filtered_gold:
-        if field in filtered_pred:
-            gold_value = filtered_gold[field]
-            pred_value = filtered_pred[field]
-            
-            if is_null_value(gold_value) and is_null_value(pred_value):
-                results["error_categories"]["perfect"] += 1
-                results["field_scores"][field] = {
-                    "gold": gold_value,
-                    "pred": pred_value,
-                    "score": 1.0,
-                    "error_type": "perfect",
-                    "weight": 1.0  # minimal weight for null-null matches
-                }
-                continue
-            
-            weight = get_field_weight(field)
-            results["total_weight"] += weight
-            
-            error_type, score = categorize_error(gold_value, pred_value, field)
-            
-            results["field_scores"][field] = {
+            if not gold_is_null:
+                missing_fields.append(field)
+                category_counts[critical_index] += 1
+                add_field(field)
+                add_gold(gold_value)
+                add_pred(None)
+                add_type("critical")
+                add_score(0.0)
+            continue
+        
+        pred_value = filtered_pred[field]
+        pred_str = stringify(pred_value)
+        pred_is_null = is_null(pred_value, pred_str)
+        
+        if gold_is_null and pred_is_null:
+            category_counts[perfect_index] += 1
+            field_scores[field] = {
                 "gold": gold_value,
                 "pred": pred_value,
-                "score": score,
-                "error_type": error_type,
-                "weight": weight
+                "score": 1.0,
+                "error_type": "perfect",
+                "weight": 1.0  # minimal weight for null-null matches
             }
-            
-            results["error_categories"][error_type] += 1
-            results["total_score"] += weight * score
-            
-            if error_type != "perfect":
-                results["detailed_errors"].append({
-                    "field": field,
-                    "gold": gold_value,
-                    "pred": pred_value,
-                    "type": error_type,
-                    "score": score
-                })
+            continue
+        
+        kind, weight = classify(field)
+        total_weight += weight
+        
+        # Null handling of categorize_error, reusing the null checks above; the
+        # category thresholds are applied by _categorize_similarity, as there
+        if gold_is_null != pred_is_null:
+            error_type, score = "critical", 0.0
+        else:
+            pair = normalized_of(field)
+            if pair is None:
+                pair = normalize(kind, gold_str), normalize(kind, pred_str)
+            error_type, score = categorize(pair[0], pair[1], similarity_of(field))
+        
+        field_scores[field] = {
+            "gold": gold_value,
+            "pred": pred_value,
+            "score": score,
+            "error_type": error_type,
+            "weight": weight
+        }
+        
+        category_counts[category_index[error_type]] += 1
+        total_score += weight * score
+        
+        if error_type != "perfect":
+            add_field(field)
+            add_gold(gold_value)
+            add_pred(pred_value)
+            add_type(error_type)
+            add_score(score)
+    
+    # The key difference is computed in C and is usually empty; the prediction
+    # is only walked, in document order, when it has extra fields
+    extra_keys = filtered_pred.keys() - filtered_gold.keys()
+    if extra_keys:
+        for field, pred_value in filtered_pred.items():
+            if field in extra_keys and not is_null_value(pred_value):
+                extra_fields.append(field)
     
     # Calculate final score
-    if results["total_weight"] > 0:
-        results["final_score"] = results["total_score"] / results["total_weight"] * 100
+    if total_weight > 0:
+        final_score = total_score / total_weight * 100
     else:
-        results["final_score"] = 0
+        final_score = 0
     
     # Calculate error distribution percentages
-    total_fields = sum(results["error_categories"].values())
+    total_fields = sum(category_counts)
     if total_fields > 0:
-        for category in results["error_categories"]:
-            results["error_categories"][category] = round(
-                (results["error_categories"][category] / total_fields) * 100, 1
-            )
+        category_counts = [round((count / total_fields) * 100, 1) for count in category_counts]
     
     # Calculate field coverage
     if len(filtered_gold) > 0:
-        results["field_coverage"] = round(
-            (len(filtered_gold) - len(results["missing_fields"])) / len(filtered_gold) * 100, 1
+        field_coverage = round(
+            (len(filtered_gold) - len(missing_fields)) / len(filtered_gold) * 100, 1
         )
     else:
-        results["field_coverage"] = 0
+        field_coverage = 0
     
-    # Sort detailed errors by score (ascending)
-    results["detailed_errors"] = sorted(
-        results["detailed_errors"], 
-        key=lambda x: (x["score"], x["field"])
-    )
+    # Sort detailed errors by score (ascending). Field names are unique, so the
+    # zipped tuples are ordered by (score, field) without a key function.
+    detailed_errors = [{
+        "field": field,
+        "gold": gold_value,
+        "pred": pred_value,
+        "type": error_type,
+        "score": score
+    } for score, field, gold_value, pred_value, error_type in sorted(
+        zip(error_scores, error_fields, error_golds, error_preds, error_types)
+    )]
     
-    return results
+    return {
+        "total_score": total_score,
+        "total_weight": total_weight,
+        "field_scores": field_scores,
+        "missing_fields": missing_fields,
+        "extra_fields": extra_fields,
+        "error_categories": dict(zip(_ERROR_CATEGORIES, category_counts)),
+        "detailed_errors": detailed_errors,
+        "final_score": final_score,
+        "field_coverage": field_coverage
+    }
 
 
+def _similarity_candidates(filtered_gold: Dict, filtered_pred: Dict) -> Iterator[Tuple[str, str, str]]:
+    """Yield (field, gold_norm, pred_norm) for the fields scored by string similarity."""
+    for field, gold_value in filtered_gold.items():
+        if field in filtered_pred:
+            pred_value = filtered_pred[field]
+            gold_str, pred_str = normalize_value(gold_value), normalize_value(pred_value)
+            if not _is_null_normalized(gold_value, gold_str) and not _is_null_normalized(pred_value, pred_str):
+                kind = _classify_field(field)[0]
+                yield field, _normalize_kind(kind, gold_str), _normalize_kind(kind, pred_str)
+
+def _evaluate_chunk(pairs: List[Tuple[str, str]], cache_dir: Optional[str] = None) -> List[Dict]:
+    """Sequential evaluate_documents_batch of a chunk of pairs, usable by a process pool."""
+    return evaluate_documents_batch(pairs, workers=1, cache_dir=cache_dir)
+
+@lru_cache(maxsize=None)
+def _code_digest() -> bytes:
+    """Digest of this script, so that cached results are dropped when it is edited."""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+def _read_file(path: str) -> bytes:
+    """Content of a file."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _file_digest(data: bytes) -> bytes:
+    """BLAKE2b digest of a file content, used in cache keys."""
+    return hashlib.blake2b(data, digest_size=20).digest()
+
+def _results_cache_path(cache_dir: str, gold_digest: bytes, pred_digest: bytes) -> str:
+    """Cache file of the results of a pair, keyed on both contents and the script."""
+    # The digests have a fixed size, so the gold/pred boundary is part of the key
+    digest = hashlib.blake2b(_code_digest() + gold_digest + pred_digest, digest_size=20)
+    return os.path.join(cache_dir, f"{digest.hexdigest()}.json")
+
+def _read_cached_results(cache_path: str) -> Optional[Dict]:
+    """Cached results, or None when missing or unreadable."""
+    try:
+        return _load_json(cache_path)
+    except (OSError, ValueError):
+        return None
+
+def _write_cache_file(cache_path: str, data: bytes) -> None:
+    """Store data in the cache, ignoring write errors."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Written under a per-process name then renamed, as pool workers
+        # may write the same cache file concurrently
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+def evaluate_documents_batch(pairs: List[Tuple[str, str]],
+                             workers: Optional[int] = None,
+                             cache_dir: Optional[str] = None) -> List[Dict]:
+    """
+    Evaluate several (gold_path, pred_path) pairs.
+
+    The string similarities of all documents are computed together in a
+    single rapidfuzz cpdist call, which runs on workers threads once there
+    are _CPDIST_THREADED_MIN pairs to compare (on one thread below). Without
+    rapidfuzz, the documents are instead evaluated in a pool of workers
+    processes, since the pure-Python similarity would otherwise be
+    serialized by the GIL. workers defaults to one per CPU; 1 disables
+    parallelism.
+
+    With a cache_dir, results are stored there keyed on a BLAKE2b hash of
+    the gold and prediction contents, and unchanged pairs are not
+    evaluated again. The cache is never pruned.
+    """
+    if cpdist is None and len(pairs) > 1 and workers != 1:
+        pool_size = workers or os.cpu_count() or 1
+        # A few chunks per worker: fewer round trips than one pair at a
+        # time, while still balancing documents of different sizes. The pairs
+        # are grouped by gold file, which each chunk only parses once.
+        chunksize = max(1, len(pairs) // (4 * pool_size))
+        order = sorted(range(len(pairs)), key=lambda index: pairs[index][0])
+        chunks = [[pairs[index] for index in order[start:start + chunksize]]
+                  for start in range(0, len(order), chunksize)]
+        batch: List[Optional[Dict]] = [None] * len(pairs)
+        with ProcessPoolExecutor(max_workers=pool_size) as executor:
+            # Each worker looks up the cached results of its own pairs
+            evaluated = (results for chunk_results in executor.map(_evaluate_chunk, chunks, repeat(cache_dir))
+                         for results in chunk_results)
+            for index, results in zip(order, evaluated):
+                batch[index] = results
+        return batch
+
+    batch: List[Optional[Dict]] = [None] * len(pairs)
+    # Indices in pairs of the documents to evaluate, and their cache files
+    misses, cache_paths = [], []
+    documents = []
+    # A gold file shared by several pairs is read, hashed and flattened once
+    gold_contents, flat_golds = {}, {}
+    for index, (gold_path, pred_path) in enumerate(pairs):
+        gold_data = gold_digest = pred_data = None
+        if cache_dir is not None:
+            # Each file is read once: the same bytes are hashed for the cache
+            # key and, on a miss, parsed
+            if gold_path not in gold_contents:
+                gold_data = _read_file(gold_path)
+                gold_contents[gold_path] = gold_data, _file_digest(gold_data)
+            gold_data, gold_digest = gold_contents[gold_path]
+            pred_data = _read_file(pred_path)
+            cache_path = _results_cache_path(cache_dir, gold_digest, _file_digest(pred_data))
+            batch[index] = _read_cached_results(cache_path)
+            if batch[index] is not None:
+                continue
+            cache_paths.append(cache_path)
+        if gold_path not in flat_golds:
+            flat_golds[gold_path] = _load_gold(gold_path, cache_dir, gold_data, gold_digest)
+        documents.append((flat_golds[gold_path], _load_pred(pred_path, pred_data)))
+        misses.append(index)
+
+    similarities = [{} for _ in documents]
+    normalized = [{} for _ in documents]
+    # Distinct (gold, pred) pairs to compare, and for each field of each
+    # document the position of its pair among them: boilerplate values and
+    # codes repeated across documents are only compared once
+    golds, preds, pair_positions = [], [], {}
+    owners, fields, positions = [], [], []
+    for index, (filtered_gold, filtered_pred) in enumerate(documents):
+        for field, gold_norm, pred_norm in _similarity_candidates(filtered_gold, filtered_pred):
+            # Kept so that score_documents does not normalize the values again
+            normalized[index][field] = gold_norm, pred_norm
+            # Equal or empty values are categorized without a similarity, and
+            # pairs whose lengths rule out the semantic cutoff are critical: only
+            # the remaining pairs are sent to the distance computation
+            if gold_norm == pred_norm or not gold_norm or not pred_norm:
+                continue
+            if _similarity_upper_bound(gold_norm, pred_norm) < SEMANTIC_THRESHOLD:
+                similarities[index][field] = 0.0
+                continue
+            position = pair_positions.get((gold_norm, pred_norm))
+            if position is None:
+                position = pair_positions[gold_norm, pred_norm] = len(golds)
+                golds.append(gold_norm)
+                preds.append(pred_norm)
+            owners.append(index)
+            fields.append(field)
+            positions.append(position)
+
+    if cpdist is not None and golds:
+        # Same cutoff as _categorize_similarity: only similarities from
+        # SEMANTIC_THRESHOLD matter. float64 so that values on the thresholds
+        # are not rounded down.
+        # Threads only pay off on large batches; a single document is faster on one
+        threads = (workers or -1) if len(golds) >= _CPDIST_THREADED_MIN else 1
+        scores = cpdist(golds, preds, scorer=Levenshtein.normalized_similarity,
+                        score_cutoff=SEMANTIC_THRESHOLD, dtype=numpy.float64, workers=threads).tolist()
+    else:
+        scores = [compute_string_similarity(g, p, score_cutoff=SEMANTIC_THRESHOLD)
+                  for g, p in zip(golds, preds)]
+
+    for index, field, position in zip(owners, fields, positions):
+        similarities[index][field] = scores[position]
+
+    for index, (filtered_gold, filtered_pred), doc_similarities, doc_normalized in zip(
+            misses, documents, similarities, normalized):
+        batch[index] = score_documents(filtered_gold, filtered_pred, doc_similarities, doc_normalized)
+    for cache_path, index in zip(cache_paths, misses):
+        _write_cache_file(cache_path, _json_dumps(batch[index]))
+    return batch
+
 def export_results_to_json(results: Dict, output_path: str) -> None:
     """Export evaluation results to JSON file."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb') as f:
+        f.write(_json_dumps(results))
     print(f"Results exported to {output_path}")
 
 def print_summary(results: Dict) -> None:
     """Print a summary of the evaluation results."""
-    print("\n" + "="*50)
-    print(f"HTR EVALUATION SUMMARY")
-    print("="*50)
-    print(f"Overall Score: {results['final_score']:.1f}%")
-    print(f"Field Coverage: {results['field_coverage']:.1f}%")
-    print("\nError Distribution:")
-    print(f"- Perfect Matches: {results['error_categories']['perfect']}%")
-    print(f"- Minor Errors: {results['error_categories']['minor']}%")
-    print(f"- Semantic Differences: {results['error_categories']['semantic']}%")
-    print(f"- Critical Errors: {results['error_categories']['critical']}%")
-    
-    print("\nMissing Fields: {len(results['missing_fields'])}")
-    print("\nExtra Fields: {len(results['extra_fields'])}")
+    # Build the whole summary first and write it to stdout in one call
+    lines = [
+        "\n" + "="*50,
+        "HTR EVALUATION SUMMARY",
+        "="*50,
+        f"Overall Score: {results['final_score']:.1f}%",
+        f"Field Coverage: {results['field_coverage']:.1f}%",
+        "\nError Distribution:",
+        f"- Perfect Matches: {results['error_categories']['perfect']}%",
+        f"- Minor Errors: {results['error_categories']['minor']}%",
+        f"- Semantic Differences: {results['error_categories']['semantic']}%",
+        f"- Critical Errors: {results['error_categories']['critical']}%",
+        f"\nMissing Fields: {len(results['missing_fields'])}",
+        f"\nExtra Fields: {len(results['extra_fields'])}",
+    ]
     
     # Print top 10 errors
     if results["detailed_errors"]:
-        print("\nTop 10 Errors:")
+        lines.append("\nTop 10 Errors:")
         for i, error in enumerate(results["detailed_errors"][:10]):
-            print(f"{i+1}. Field: {error['field']}")
-            print(f"   Gold: {error['gold']}")
-            print(f"   Pred: {error['pred']}")
-            print(f"   Type: {error['type']}")
-            print()
+            lines.append(f"{i+1}. Field: {error['field']}")
+            lines.append(f"   Gold: {error['gold']}")
+            lines.append(f"   Pred: {error['pred']}")
+            lines.append(f"   Type: {error['type']}")
+            lines.append("")
     
-    print("="*50)
+    lines.append("="*50)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def launch_dashboard(dashboard_dir: str, results_path: str) -> None:
     """
@@ -347,22 +997,74 @@ def launch_dashboard(dashboard_dir: str, results_path: str) -> None:
 
 
 
-def main():
+def collect_document_pairs(gold_path: str, pred_dir: str) -> List[Tuple[str, str]]:
+    """
+    Pair every prediction JSON in pred_dir with its gold standard.
+
+    gold_path is either a single gold file shared by all predictions, or a
+    directory holding a gold file with the same name as each prediction.
+    """
+    pairs = []
+    for name in sorted(os.listdir(pred_dir)):
+        if not name.endswith('.json'):
+            continue
+        gold_file = os.path.join(gold_path, name) if os.path.isdir(gold_path) else gold_path
+        if not os.path.isfile(gold_file):
+            print(f"Skipping {name}: no gold standard found at {gold_file}")
+            continue
+        pairs.append((gold_file, os.path.join(pred_dir, name)))
+    return pairs
+
+def evaluate_directory(gold_path: str, pred_dir: str, output_dir: str,
+                       workers: Optional[int] = None, cache_dir: Optional[str] = None) -> None:
+    """Evaluate a directory of predictions and export one results file per document."""
+    pairs = collect_document_pairs(gold_path, pred_dir)
+    print(f"Evaluating {len(pairs)} documents from {pred_dir}...")
+
+    for (_, pred_path), results in zip(pairs, evaluate_documents_batch(pairs, workers, cache_dir)):
+        pred_filename = os.path.splitext(os.path.basename(pred_path))[0]
+        output_json = os.path.join(output_dir, f"{pred_filename}_evaluation_results.json")
+        print(f"{pred_filename}: {results['final_score']:.1f}% "
+              f"(coverage {results['field_coverage']:.1f}%)")
+        export_results_to_json(results, output_json)
+
+def _positive_int(value: str) -> int:
+    """argparse type of --workers: an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def main() -> None:
     """Main function to run the evaluation script."""
     parser = argparse.ArgumentParser(description='Evaluate HTR document against gold standard.')
-    parser.add_argument('gold_path', help='Path to the gold standard JSON file')
-    parser.add_argument('pred_path', help='Path to the predicted JSON file')
+    parser.add_argument('gold_path', help='Path to the gold standard JSON file (or a directory of gold files)')
+    parser.add_argument('pred_path', help='Path to the predicted JSON file (or a directory of predictions)')
     parser.add_argument('--output_dir', help='Directory to save the evaluation results', default='./output/')
+    parser.add_argument('--workers', type=_positive_int, default=None,
+                        help='Number of parallel workers in batch mode (default: one per CPU, 1 to disable). '
+                             'With rapidfuzz, threads are only used from 10,000 value pairs to compare')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse the results of unchanged documents, cached in <output_dir>/.cache')
     
     args = parser.parse_args()
     
+    os.makedirs(args.output_dir, exist_ok=True)
+    cache_dir = os.path.join(args.output_dir, '.cache') if args.cache else None
+    
+    # Batch mode: results are exported for every document, without dashboards
+    if os.path.isdir(args.pred_path):
+        evaluate_directory(args.gold_path, args.pred_path, args.output_dir, args.workers, cache_dir)
+        return
+    
     pred_filename = os.path.splitext(os.path.basename(args.pred_path))[0]
     output_json = os.path.join(args.output_dir, f"{pred_filename}_evaluation_results.json")
     dashboard_dir = os.path.join(args.output_dir, f"{pred_filename}_dashboard")
     
-    os.makedirs(args.output_dir, exist_ok=True)
-    
-    results = evaluate_documents(args.gold_path, args.pred_path)
+    results = evaluate_documents(args.gold_path, args.pred_path, cache_dir)
     print_summary(results)
     export_results_to_json(results, output_json)
     